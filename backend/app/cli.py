@@ -0,0 +1,381 @@
+"""Headless bulk processing of assay designs without starting the HTTP server.
+
+Designs are read from a JSONL file (one plate map payload per line, as posted
+to ``/plate-map``) or a CSV file, processed across a pool of worker processes,
+and streamed to disk in input order::
+
+    python backend/app/cli.py designs.jsonl --output results.jsonl
+    python backend/app/cli.py designs.csv --format csv --output wells.csv
+    python backend/app/cli.py designs.jsonl --format files --output results/
+
+A JSONL design may carry a ``dilutions`` object (the ``/dilutions`` payload) and
+a ``reagent_b`` object (the ``/reagent-b`` payload). Counts missing from
+``reagent_b`` are derived from the plate map design, so only
+``volume_per_replicate_uL`` is required. CSV designs use the same column names,
+with list values separated by ``;``; ``stock_concentrations_uM`` lists one stock
+per test article.
+
+With ``--format csv`` the wells go to the CSV (failed designs get a single row
+with the ``error`` column set) and any dilution or reagent B results go to a
+companion ``<output>.calculations.jsonl`` file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+try:  # pragma: no cover - import shim for direct execution
+    from .main import _parse_dilution_payload, _parse_reagent_b_payload, _plate_map_design
+    from .services import (
+        calculate_concentrations,
+        calculate_reagent_b_requirements,
+        generate_plate_maps,
+    )
+    from .store import layout_id_for
+except ImportError:  # pragma: no cover - fallback when run as a script
+    CURRENT_DIR = Path(__file__).resolve().parent
+    if str(CURRENT_DIR) not in sys.path:
+        sys.path.insert(0, str(CURRENT_DIR))
+
+    from main import _parse_dilution_payload, _parse_reagent_b_payload, _plate_map_design  # type: ignore
+    from services import (  # type: ignore
+        calculate_concentrations,
+        calculate_reagent_b_requirements,
+        generate_plate_maps,
+    )
+    from store import layout_id_for  # type: ignore
+
+OUTPUT_FORMATS = ("jsonl", "csv", "files")
+CSV_LIST_SEPARATOR = ";"
+CSV_LIST_COLUMNS = {"test_articles", "cell_lines", "timepoints", "stock_concentrations_uM"}
+CSV_BOOLEAN_COLUMNS = {"include_live_dead", "include_unstained", "condense_cell_lines"}
+CSV_NUMBER_COLUMNS = {"replicates", "final_concentration_uM", "total_volume_uL", "volume_per_replicate_uL"}
+WELL_CSV_HEADER = [
+    "design_id",
+    "plate_index",
+    "well_id",
+    "row",
+    "column",
+    "test_article",
+    "cell_line",
+    "timepoint",
+    "error",
+]
+
+Design = Tuple[str, Dict[str, Any]]
+
+
+def _parse_csv_boolean(key: str, value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in {"true", "yes", "1"}:
+        return True
+    if normalized in {"false", "no", "0"}:
+        return False
+    raise ValueError(f"'{key}' must be a boolean value")
+
+
+def _parse_csv_number(key: str, value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise ValueError(f"'{key}' must be numeric") from exc
+    if not math.isfinite(number):
+        raise ValueError(f"'{key}' must be a finite number")
+    return int(number) if number.is_integer() else number
+
+
+def _csv_row_to_payload(row: Dict[str, str]) -> Dict[str, Any]:
+    """Convert a CSV row into the same payload shape the JSON API accepts."""
+
+    payload: Dict[str, Any] = {}
+    for key, raw in row.items():
+        if key is None or raw is None or not raw.strip() or key == "design_id":
+            continue
+        if key in CSV_LIST_COLUMNS:
+            payload[key] = [item.strip() for item in raw.split(CSV_LIST_SEPARATOR) if item.strip()]
+        elif key in CSV_BOOLEAN_COLUMNS:
+            payload[key] = _parse_csv_boolean(key, raw)
+        elif key in CSV_NUMBER_COLUMNS:
+            payload[key] = _parse_csv_number(key, raw)
+        else:
+            payload[key] = raw.strip()
+
+    stocks = payload.pop("stock_concentrations_uM", None)
+    final_conc = payload.pop("final_concentration_uM", None)
+    total_volume = payload.pop("total_volume_uL", None)
+    if stocks is not None:
+        articles = payload.get("test_articles") or []
+        if len(stocks) != len(articles):
+            raise ValueError("'stock_concentrations_uM' must list one stock per test article")
+        payload["dilutions"] = {
+            "items": [
+                {"test_article": article, "stock_concentration_uM": _parse_csv_number("stock_concentrations_uM", stock)}
+                for article, stock in zip(articles, stocks)
+            ],
+            "final_concentration_uM": final_conc,
+            "total_volume_uL": total_volume,
+        }
+
+    volume = payload.pop("volume_per_replicate_uL", None)
+    if volume is not None:
+        payload["reagent_b"] = {"volume_per_replicate_uL": volume}
+    return payload
+
+
+def iter_designs(path: Path) -> Iterator[Design]:
+    """Yield ``(design_id, payload)`` pairs lazily from a JSONL or CSV file.
+
+    Rows that cannot be decoded are yielded with an ``__error__`` message as
+    the payload so they are reported alongside validation failures.
+    """
+
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        if path.suffix.lower() == ".csv":
+            for line_number, row in enumerate(csv.DictReader(handle), start=2):
+                design_id = (row.get("design_id") or "").strip() or f"design-{line_number}"
+                try:
+                    yield design_id, _csv_row_to_payload(row)
+                except ValueError as exc:
+                    yield design_id, {"__error__": str(exc)}
+            return
+
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                yield f"design-{line_number}", {"__error__": "Invalid JSON payload"}
+                continue
+            if not isinstance(payload, dict):
+                yield f"design-{line_number}", {"__error__": "Each design must be an object"}
+                continue
+            design_id = str(payload.pop("design_id", "") or f"design-{line_number}")
+            yield design_id, payload
+
+
+def process_design(design: Design) -> Dict[str, Any]:
+    """Validate and compute one design exactly as the HTTP endpoints would."""
+
+    design_id, payload = design
+    try:
+        if "__error__" in payload:
+            raise ValueError(payload["__error__"])
+
+        plate_design = _plate_map_design(payload)
+        result: Dict[str, Any] = {
+            "design_id": design_id,
+            "layout_id": layout_id_for(plate_design),
+            "plates": generate_plate_maps(**plate_design),
+        }
+
+        dilution_payload = payload.get("dilutions")
+        if dilution_payload is not None:
+            if not isinstance(dilution_payload, dict):
+                raise ValueError("'dilutions' must be an object")
+            items, final_conc, total_volume = _parse_dilution_payload(dilution_payload)
+            result["dilutions"] = calculate_concentrations(items, final_conc, total_volume)
+
+        reagent_payload = payload.get("reagent_b")
+        if reagent_payload is not None:
+            if not isinstance(reagent_payload, dict):
+                raise ValueError("'reagent_b' must be an object")
+            reagent_payload = {
+                "number_of_timepoints": len(plate_design["timepoints"]),
+                "number_of_test_articles": len(plate_design["test_articles"]),
+                "number_of_cell_lines": len(plate_design["cell_lines"]),
+                "replicates_per_condition": plate_design["replicates"],
+                **reagent_payload,
+            }
+            result["reagent_b"] = calculate_reagent_b_requirements(*_parse_reagent_b_payload(reagent_payload))
+        return result
+    except ValueError as exc:
+        return {"design_id": design_id, "error": str(exc)}
+    except Exception as exc:  # noqa: BLE001 - one bad design must not abort the batch
+        return {"design_id": design_id, "error": f"{type(exc).__name__}: {exc}"}
+
+
+class _ResultWriter:
+    """Write processed designs to disk one at a time so memory stays bounded."""
+
+    def __init__(self, output: Path, output_format: str) -> None:
+        self.output_format = output_format
+        self.output = output
+        self._handle: Optional[TextIO] = None
+        self._csv_writer: Optional[Any] = None
+        self._calculations_handle: Optional[TextIO] = None
+        self._written_names: Set[str] = set()
+
+        if output_format == "files":
+            output.mkdir(parents=True, exist_ok=True)
+            return
+        output.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = output.open("w", encoding="utf-8", newline="")
+        if output_format == "csv":
+            self._csv_writer = csv.writer(self._handle)
+            self._csv_writer.writerow(WELL_CSV_HEADER)
+
+    def write(self, result: Dict[str, Any]) -> None:
+        if self.output_format == "jsonl":
+            assert self._handle is not None
+            self._handle.write(json.dumps(result) + "\n")
+        elif self.output_format == "csv":
+            assert self._csv_writer is not None
+            if "error" in result:
+                self._csv_writer.writerow(
+                    [result["design_id"]] + [""] * (len(WELL_CSV_HEADER) - 2) + [result["error"]]
+                )
+                return
+            self._write_calculations(result)
+            for plate_index, plate in enumerate(result.get("plates", [])):
+                for well in plate["wells"]:
+                    self._csv_writer.writerow(
+                        [
+                            result["design_id"],
+                            plate_index,
+                            well["well_id"],
+                            well["row"],
+                            well["column"],
+                            well["test_article"],
+                            well["cell_line"],
+                            well["timepoint"],
+                            "",
+                        ]
+                    )
+        else:
+            name = "".join(char if char.isalnum() or char in "-_." else "_" for char in result["design_id"])
+            candidate, suffix = name, 1
+            while candidate in self._written_names:
+                candidate = f"{name}-{suffix}"
+                suffix += 1
+            self._written_names.add(candidate)
+            name = candidate
+            with (self.output / f"{name}.json").open("w", encoding="utf-8") as handle:
+                json.dump(result, handle)
+
+    @property
+    def calculations_path(self) -> Path:
+        return self.output.with_name(self.output.name + ".calculations.jsonl")
+
+    def _write_calculations(self, result: Dict[str, Any]) -> None:
+        calculations = {key: result[key] for key in ("dilutions", "reagent_b") if key in result}
+        if not calculations:
+            return
+        if self._calculations_handle is None:
+            self._calculations_handle = self.calculations_path.open("w", encoding="utf-8")
+        record = {"design_id": result["design_id"], "layout_id": result["layout_id"], **calculations}
+        self._calculations_handle.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        if self._calculations_handle is not None:
+            self._calculations_handle.close()
+
+
+def _report_progress(stream: TextIO, processed: int, failed: int, started: float, *, final: bool = False) -> None:
+    elapsed = max(time.monotonic() - started, 1e-9)
+    message = f"{processed} designs processed, {failed} failed ({processed / elapsed:.1f} designs/s)"
+    if final:
+        message += f" in {elapsed:.2f}s"
+    stream.write("\r" + message + ("\n" if final else ""))
+    stream.flush()
+
+
+def run_batch(
+    input_path: Path,
+    output_path: Path,
+    *,
+    output_format: str = "jsonl",
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    progress_interval: float = 1.0,
+    progress_stream: TextIO = sys.stderr,
+) -> Tuple[int, int]:
+    """Process every design in ``input_path`` and return ``(processed, failed)``.
+
+    At most ``max_in_flight`` designs are queued at once and results are
+    written in input order as soon as they complete.
+    """
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"'output_format' must be one of {', '.join(OUTPUT_FORMATS)}")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+
+    writer = _ResultWriter(output_path, output_format)
+    pending: Deque[Future] = deque()
+    processed = failed = 0
+    started = last_report = time.monotonic()
+
+    def drain_one() -> None:
+        nonlocal processed, failed, last_report
+        result = pending.popleft().result()
+        processed += 1
+        if "error" in result:
+            failed += 1
+            progress_stream.write(f"\r{result['design_id']}: {result['error']}\n")
+        writer.write(result)
+        now = time.monotonic()
+        if progress_interval and now - last_report >= progress_interval:
+            last_report = now
+            _report_progress(progress_stream, processed, failed, started)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for design in iter_designs(input_path):
+                pending.append(executor.submit(process_design, design))
+                if len(pending) >= max_in_flight:
+                    drain_one()
+            while pending:
+                drain_one()
+    finally:
+        writer.close()
+
+    _report_progress(progress_stream, processed, failed, started, final=True)
+    return processed, failed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Process assay designs in bulk without the HTTP server.")
+    parser.add_argument("input", type=Path, help="JSONL or CSV file with one design per line")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="output file, or directory for --format files")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="jsonl", help="output format (default: jsonl)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="designs queued at once, bounding memory (default: 4 x workers)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.input.is_file():
+        parser.error(f"input file not found: {args.input}")
+    if args.workers is not None and args.workers <= 0:
+        parser.error("--workers must be greater than zero")
+    if args.max_in_flight is not None and args.max_in_flight <= 0:
+        parser.error("--max-in-flight must be greater than zero")
+
+    _, failed = run_batch(
+        args.input,
+        args.output,
+        output_format=args.format,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
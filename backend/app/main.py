@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import json
+import math
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import mimetypes
+import os
+import re
 
 FRONTEND_DIR = Path(__file__).resolve().parents[2] / "frontend"
 
@@ -29,10 +32,14 @@ def _load_static_file(request_path: str) -> Tuple[bytes, str]:
 
 try:  # pragma: no cover - import shim for direct execution
     from .services import (
+        MAX_PLATE_COLUMNS,
         calculate_concentrations,
         calculate_reagent_b_requirements,
+        count_plate_maps,
         generate_plate_maps,
+        iter_plate_maps,
     )
+    from .store import DEFAULT_MAX_BYTES, DEFAULT_STORE_PATH, LayoutStore, layout_id_for
 except ImportError:  # pragma: no cover - fallback when run as a script
     import sys
     from pathlib import Path
@@ -42,22 +49,43 @@ except ImportError:  # pragma: no cover - fallback when run as a script
         sys.path.insert(0, str(CURRENT_DIR))
 
     from services import (  # type: ignore
+        MAX_PLATE_COLUMNS,
         calculate_concentrations,
         calculate_reagent_b_requirements,
+        count_plate_maps,
         generate_plate_maps,
+        iter_plate_maps,
     )
+    from store import DEFAULT_MAX_BYTES, DEFAULT_STORE_PATH, LayoutStore, layout_id_for  # type: ignore
 
+LAYOUT_PATH_PATTERN = re.compile(r"^/layouts/(?P<layout_id>[0-9a-f]{32})(?:/plates/(?P<plate_index>\d{1,9}))?/?$")
 
-def _json_response(handler: BaseHTTPRequestHandler, status: HTTPStatus, payload: Any) -> None:
+
+def _json_response(
+    handler: BaseHTTPRequestHandler,
+    status: HTTPStatus,
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+) -> None:
     data = json.dumps(payload).encode("utf-8")
     handler.send_response(status.value)
     handler.send_header("Content-Type", "application/json")
     handler.send_header("Content-Length", str(len(data)))
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
     handler.send_header("Access-Control-Allow-Origin", "*")
     handler.end_headers()
     handler.wfile.write(data)
 
 
+def _sse_event(handler: BaseHTTPRequestHandler, event: str, payload: Any) -> None:
+    """Write one Server-Sent Events frame and flush it to the client."""
+
+    frame = f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+    handler.wfile.write(frame)
+    handler.wfile.flush()
+
+
 def _json_error(handler: BaseHTTPRequestHandler, status: HTTPStatus, message: str) -> None:
     _json_response(handler, status, {"detail": message})
 
@@ -95,6 +123,8 @@ def _ensure_list_of_numbers(key: str, value: Any) -> List[float]:
                 raise ValueError(f"All entries in '{key}' must be numeric") from exc
         else:
             raise ValueError(f"All entries in '{key}' must be numeric")
+        if not math.isfinite(numbers[-1]):
+            raise ValueError(f"All entries in '{key}' must be finite numbers")
     return numbers
 
 
@@ -125,7 +155,7 @@ def _parse_plate_map_payload(
     if orientation not in VALID_ORIENTATIONS:
         raise ValueError("'orientation' must be either 'horizontal' or 'vertical'")
     replicates_raw = payload.get("replicates", 2)
-    if not isinstance(replicates_raw, (int, float)):
+    if not isinstance(replicates_raw, (int, float)) or not math.isfinite(replicates_raw):
         raise ValueError("'replicates' must be a positive number")
     replicates = int(replicates_raw)
     if replicates <= 0:
@@ -144,6 +174,39 @@ def _parse_plate_map_payload(
     return test_articles, cell_lines, timepoints, orientation, replicates, include_live_dead, include_unstained, condense_cell_lines
 
 
+def _plate_map_design(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the validated plate map parameters as keyword arguments for ``generate_plate_maps``."""
+
+    (
+        test_articles,
+        cell_lines,
+        timepoints,
+        orientation,
+        replicates,
+        include_live_dead,
+        include_unstained,
+        condense_cell_lines,
+    ) = _parse_plate_map_payload(payload)
+    return {
+        "test_articles": test_articles,
+        "cell_lines": cell_lines,
+        "timepoints": timepoints,
+        "orientation": orientation,
+        "replicates": replicates,
+        "include_live_dead": include_live_dead,
+        "include_unstained": include_unstained,
+        "condense_cell_lines": condense_cell_lines,
+    }
+
+
+def _etag_matches(handler: BaseHTTPRequestHandler, etag: str) -> bool:
+    header = handler.headers.get("If-None-Match")
+    if not header:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
 def _parse_dilution_payload(payload: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], float, float]:
     items_raw = payload.get("items")
     if not isinstance(items_raw, list) or not items_raw:
@@ -157,7 +220,7 @@ def _parse_dilution_payload(payload: Dict[str, Any]) -> Tuple[List[Dict[str, Any
         stock = entry.get("stock_concentration_uM")
         if not isinstance(test_article, str) or not test_article.strip():
             raise ValueError("Each item must include 'test_article'")
-        if not isinstance(stock, (int, float)):
+        if not isinstance(stock, (int, float)) or not math.isfinite(stock):
             raise ValueError("Each item must include numeric 'stock_concentration_uM'")
         items.append(
             {
@@ -171,6 +234,8 @@ def _parse_dilution_payload(payload: Dict[str, Any]) -> Tuple[List[Dict[str, Any
         total_volume = float(payload.get("total_volume_uL"))
     except (TypeError, ValueError) as exc:
         raise ValueError("Final concentration and total volume must be numeric values") from exc
+    if not math.isfinite(final_conc) or not math.isfinite(total_volume):
+        raise ValueError("Final concentration and total volume must be numeric values")
 
     return items, final_conc, total_volume
 
@@ -185,12 +250,12 @@ def _parse_reagent_b_payload(payload: Dict[str, Any]) -> Tuple[int, int, int, in
     values: Dict[str, int] = {}
     for key in required_int_keys:
         value = payload.get(key)
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)) or not math.isfinite(value):
             raise ValueError(f"'{key}' must be a positive number")
         values[key] = int(value)
 
     volume = payload.get("volume_per_replicate_uL")
-    if not isinstance(volume, (int, float)):
+    if not isinstance(volume, (int, float)) or not math.isfinite(volume):
         raise ValueError("'volume_per_replicate_uL' must be a positive number")
 
     return (
@@ -210,7 +275,8 @@ class AssayRequestHandler(BaseHTTPRequestHandler):
 
     def end_headers(self) -> None:  # pragma: no cover - ensures CORS on all responses
         self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, If-None-Match")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         super().end_headers()
 
@@ -246,6 +312,11 @@ class AssayRequestHandler(BaseHTTPRequestHandler):
             _json_response(self, HTTPStatus.OK, {"message": "Antibody Assay Setup API is running"})
             return
 
+        layout_match = LAYOUT_PATH_PATTERN.match(normalized)
+        if layout_match:
+            self._handle_layout(layout_match.group("layout_id"), layout_match.group("plate_index"))
+            return
+
         _json_error(self, HTTPStatus.NOT_FOUND, "Endpoint not found")
 
     def do_POST(self) -> None:  # noqa: N802
@@ -253,6 +324,8 @@ class AssayRequestHandler(BaseHTTPRequestHandler):
             payload = _read_json_body(self)
             if self.path == "/plate-map":
                 self._handle_plate_map(payload)
+            elif self.path == "/plate-map/stream":
+                self._handle_plate_map_stream(payload)
             elif self.path == "/dilutions":
                 self._handle_dilutions(payload)
             elif self.path == "/reagent-b":
@@ -262,28 +335,115 @@ class AssayRequestHandler(BaseHTTPRequestHandler):
         except ValueError as exc:
             _json_error(self, HTTPStatus.BAD_REQUEST, str(exc))
 
+    @property
+    def layout_store(self) -> Optional[LayoutStore]:
+        return getattr(self.server, "layout_store", None)
+
     def _handle_plate_map(self, payload: Dict[str, Any]) -> None:
-        (
-            test_articles,
-            cell_lines,
-            timepoints,
-            orientation,
-            replicates,
-            include_live_dead,
-            include_unstained,
-            condense_cell_lines,
-        ) = _parse_plate_map_payload(payload)
-        plates = generate_plate_maps(
-            test_articles,
-            cell_lines,
-            timepoints,
-            orientation=orientation,
-            replicates=replicates,
-            include_live_dead=include_live_dead,
-            include_unstained=include_unstained,
-            condense_cell_lines=condense_cell_lines,
+        design = _plate_map_design(payload)
+        store = self.layout_store
+        if store is None:
+            plates = generate_plate_maps(**design)
+            _json_response(self, HTTPStatus.OK, {"plates": plates})
+            return
+
+        layout_id = layout_id_for(design)
+        stored = store.get_layout(layout_id)
+        if stored is not None:
+            plates = stored["plates"]
+        else:
+            plates = generate_plate_maps(**design)
+            store.save(design, plates)
+        _json_response(
+            self,
+            HTTPStatus.OK,
+            {"layout_id": layout_id, "plates": plates},
+            headers={"ETag": f'"{layout_id}"'},
         )
-        _json_response(self, HTTPStatus.OK, {"plates": plates})
+
+    def _handle_plate_map_stream(self, payload: Dict[str, Any]) -> None:
+        """Stream plates as Server-Sent Events as soon as each one is generated.
+
+        Emits ``start`` with the expected plate count, then a ``plate`` and a
+        ``progress`` event per plate, and finally ``done`` (or ``error``).
+        Generation stops as soon as the client disconnects.
+        """
+
+        design = _plate_map_design(payload)
+        # Validation errors surface here, before the stream starts, as a normal 400.
+        total = count_plate_maps(**design)
+        store = self.layout_store
+        layout_id = layout_id_for(design) if store is not None else None
+        stored = store.get_layout(layout_id) if store is not None and layout_id is not None else None
+        plates_iter = iter(stored["plates"]) if stored is not None else iter_plate_maps(**design)
+
+        self.send_response(HTTPStatus.OK.value)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Accel-Buffering", "no")
+        self.end_headers()
+
+        plates: List[Dict[str, object]] = []
+        try:
+            _sse_event(self, "start", {"total": total, "layout_id": layout_id})
+            for index, plate in enumerate(plates_iter):
+                plates.append(plate)
+                _sse_event(self, "plate", {"index": index, "plate": plate})
+                _sse_event(self, "progress", {"completed": index + 1, "total": total})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; dropping the generator cancels the remaining work.
+            self.close_connection = True
+            return
+        except ValueError as exc:
+            try:
+                _sse_event(self, "error", {"detail": str(exc)})
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            self.close_connection = True
+            return
+        finally:
+            close = getattr(plates_iter, "close", None)
+            if close is not None:
+                close()
+
+        if store is not None and stored is None:
+            store.save(design, plates)
+        try:
+            _sse_event(self, "done", {"count": len(plates), "layout_id": layout_id})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        self.close_connection = True
+
+    def _handle_layout(self, layout_id: str, plate_index: Optional[str]) -> None:
+        store = self.layout_store
+        if store is None:
+            _json_error(self, HTTPStatus.NOT_FOUND, "Layout storage is disabled")
+            return
+
+        etag = f'"{layout_id}"' if plate_index is None else f'"{layout_id}-{plate_index}"'
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+        # Layout IDs cover the design and LAYOUT_VERSION, so a stored layout never changes.
+        index = None if plate_index is None else int(plate_index)
+        if _etag_matches(self, etag) and store.contains(layout_id, index):
+            self.send_response(HTTPStatus.NOT_MODIFIED.value)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        if plate_index is None:
+            layout = store.get_layout(layout_id)
+            if layout is None:
+                _json_error(self, HTTPStatus.NOT_FOUND, "Layout not found")
+                return
+            _json_response(self, HTTPStatus.OK, layout, headers=headers)
+            return
+
+        plate = store.get_plate(layout_id, int(plate_index))
+        if plate is None:
+            _json_error(self, HTTPStatus.NOT_FOUND, "Plate not found")
+            return
+        _json_response(self, HTTPStatus.OK, plate, headers=headers)
 
     def _handle_dilutions(self, payload: Dict[str, Any]) -> None:
         items, final_conc, total_volume = _parse_dilution_payload(payload)
@@ -322,15 +482,33 @@ class AssayRequestHandler(BaseHTTPRequestHandler):
             self.wfile.write(content)
 
 
-def run(host: str = "0.0.0.0", port: int = 8000) -> None:
-    """Start the HTTP server."""
+def run(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    store_path: Optional[Path] = None,
+    store_max_bytes: Optional[int] = None,
+) -> None:
+    """Start the HTTP server.
+
+    Generated layouts are persisted to ``store_path`` (``ASSAY_STORE_PATH`` by
+    default) so they can be fetched again from ``/layouts/<layout_id>``.
+    """
+
+    if store_path is None:
+        store_path = Path(os.environ.get("ASSAY_STORE_PATH", DEFAULT_STORE_PATH))
+    if store_max_bytes is None:
+        store_max_bytes = int(os.environ.get("ASSAY_STORE_MAX_BYTES", DEFAULT_MAX_BYTES))
 
+    layout_store = LayoutStore(store_path, max_bytes=store_max_bytes)
     with ThreadingHTTPServer((host, port), AssayRequestHandler) as httpd:
+        httpd.layout_store = layout_store  # type: ignore[attr-defined]
         print(f"Serving antibody assay API on http://{host}:{port}")
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:  # pragma: no cover - manual shutdown
             print("\nShutting down server...")
+        finally:
+            layout_store.close()
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 ROW_LABELS = ["A", "B", "C", "D", "E", "F", "G", "H"]
 COLUMN_RANGE = list(range(1, 13))
 NEGATIVE_CONTROL = "HB-44976-b1"
 LIVE_DEAD_CONTROL = "live:dead"
 UNSTAINED_CONTROL = "unstained"
+MAX_PLATE_COLUMNS = len(COLUMN_RANGE)
+# Bump whenever generate_plate_maps would produce different plates for the
+# same design; it is part of every stored layout ID.
+LAYOUT_VERSION = 1
 
+Coordinate = Tuple[str, int]
 
-def _well_positions() -> List[Tuple[str, int]]:
-    positions: List[Tuple[str, int]] = []
+
+def _well_positions() -> List[Coordinate]:
+    positions: List[Coordinate] = []
+    for row in ROW_LABELS:
+        for column in COLUMN_RANGE:
+            positions.append((row, column))
+    return positions
+
+
+def _validate_replicates(replicates: int) -> int:
+    replicates = int(replicates)
+    if replicates <= 0:
+        raise ValueError("Replicates must be greater than zero.")
+    if replicates > MAX_PLATE_COLUMNS:
+        raise ValueError("Replicates cannot exceed the number of plate columns.")
+    return replicates
+
+
+def _horizontal_groups(replicates: int) -> List[Sequence[Coordinate]]:
+    groups: List[Sequence[Coordinate]] = []
     for row in ROW_LABELS:
         start_column = replicates + 1 if row == "A" else 1
         for column in range(start_column, COLUMN_RANGE[-1] + 1, replicates):
@@ -46,6 +69,7 @@ def _assignment_groups(orientation: str, replicates: int) -> List[Sequence[Coord
         if orientation == "vertical"
         else _horizontal_groups(replicates)
     )
+    return groups
 
 
 ALL_POSITIONS = _well_positions()
@@ -135,7 +159,25 @@ def _generate_single_cell_line_wells(
     return wells, current_group_index
 
 
-def generate_plate_maps(
+def _max_cell_lines_per_plate(
+    assignment_groups: List[Sequence[Coordinate]], items_per_cell_line: int, replicates: int
+) -> int:
+    # Each cell line needs: replicates (for negative controls) + items_per_cell_line groups
+    # But negative controls are in row A, so we need to check if we have enough row A columns
+    max_negative_controls_in_row_a = COLUMN_RANGE[-1] // replicates
+    max_cell_lines_by_controls = max_negative_controls_in_row_a
+    max_cell_lines_by_groups = len(assignment_groups) // items_per_cell_line
+    max_cell_lines_per_plate = min(max_cell_lines_by_controls, max_cell_lines_by_groups)
+
+    if max_cell_lines_per_plate < 1:
+        raise ValueError(
+            "Cannot condense cell lines: insufficient space on plate. "
+            "Each cell line requires more groups or negative control columns than available."
+        )
+    return max_cell_lines_per_plate
+
+
+def count_plate_maps(
     test_articles: List[str],
     cell_lines: List[str],
     timepoints: List[float],
@@ -145,30 +187,47 @@ def generate_plate_maps(
     include_live_dead: bool = True,
     include_unstained: bool = True,
     condense_cell_lines: bool = False,
-) -> List[Dict[str, object]]:
+) -> int:
+    """Return how many plates ``generate_plate_maps`` produces for the same arguments."""
+
     replicates = _validate_replicates(replicates)
     controls_needed = sum([include_live_dead, include_unstained])
     items_per_cell_line = len(test_articles) + controls_needed
     _validate_capacity(items_per_cell_line, orientation, replicates, 0)
 
-    assignment_groups = _assignment_groups(orientation, replicates)
+    if condense_cell_lines and len(cell_lines) > 1:
+        assignment_groups = _assignment_groups(orientation, replicates)
+        per_plate = _max_cell_lines_per_plate(assignment_groups, items_per_cell_line, replicates)
+        batches = -(-len(cell_lines) // per_plate)
+        return batches * len(timepoints)
+    return len(cell_lines) * len(timepoints)
+
+
+def iter_plate_maps(
+    test_articles: List[str],
+    cell_lines: List[str],
+    timepoints: List[float],
+    *,
+    orientation: str = "horizontal",
+    replicates: int = 2,
+    include_live_dead: bool = True,
+    include_unstained: bool = True,
+    condense_cell_lines: bool = False,
+) -> Iterator[Dict[str, object]]:
+    """Yield plates one at a time, in the same order as ``generate_plate_maps``."""
+
+    replicates = _validate_replicates(replicates)
+    controls_needed = sum([include_live_dead, include_unstained])
+    items_per_cell_line = len(test_articles) + controls_needed
+    _validate_capacity(items_per_cell_line, orientation, replicates, 0)
 
-    plates: List[Dict[str, object]] = []
+    assignment_groups = _assignment_groups(orientation, replicates)
 
     if condense_cell_lines and len(cell_lines) > 1:
         # Calculate how many cell lines can fit per plate
-        # Each cell line needs: replicates (for negative controls) + items_per_cell_line groups
-        # But negative controls are in row A, so we need to check if we have enough row A columns
-        max_negative_controls_in_row_a = COLUMN_RANGE[-1] // replicates
-        max_cell_lines_by_controls = max_negative_controls_in_row_a
-        max_cell_lines_by_groups = len(assignment_groups) // items_per_cell_line
-        max_cell_lines_per_plate = min(max_cell_lines_by_controls, max_cell_lines_by_groups)
-        
-        if max_cell_lines_per_plate < 1:
-            raise ValueError(
-                "Cannot condense cell lines: insufficient space on plate. "
-                "Each cell line requires more groups or negative control columns than available."
-            )
+        max_cell_lines_per_plate = _max_cell_lines_per_plate(
+            assignment_groups, items_per_cell_line, replicates
+        )
 
         for timepoint in timepoints:
             # Group cell lines into batches that fit on one plate
@@ -206,14 +265,12 @@ def generate_plate_maps(
                         well["column"],
                     )
                 )
-                plates.append(
-                    {
-                        "cell_lines": plate_cell_lines,
-                        "timepoint": timepoint,
-                        "replicates": replicates,
-                        "wells": wells,
-                    }
-                )
+                yield {
+                    "cell_lines": plate_cell_lines,
+                    "timepoint": timepoint,
+                    "replicates": replicates,
+                    "wells": wells,
+                }
     else:
         # Original behavior: one plate per cell_line × timepoint
         for cell_line in cell_lines:
@@ -235,16 +292,37 @@ def generate_plate_maps(
                         well["column"],
                     )
                 )
-                plates.append(
-                    {
-                        "cell_line": cell_line,
-                        "timepoint": timepoint,
-                        "replicates": replicates,
-                        "wells": wells,
-                    }
-                )
+                yield {
+                    "cell_line": cell_line,
+                    "timepoint": timepoint,
+                    "replicates": replicates,
+                    "wells": wells,
+                }
+
 
-    return plates
+def generate_plate_maps(
+    test_articles: List[str],
+    cell_lines: List[str],
+    timepoints: List[float],
+    *,
+    orientation: str = "horizontal",
+    replicates: int = 2,
+    include_live_dead: bool = True,
+    include_unstained: bool = True,
+    condense_cell_lines: bool = False,
+) -> List[Dict[str, object]]:
+    return list(
+        iter_plate_maps(
+            test_articles,
+            cell_lines,
+            timepoints,
+            orientation=orientation,
+            replicates=replicates,
+            include_live_dead=include_live_dead,
+            include_unstained=include_unstained,
+            condense_cell_lines=condense_cell_lines,
+        )
+    )
 
 
 def calculate_concentrations(
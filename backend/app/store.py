@@ -0,0 +1,180 @@
+"""SQLite-backed store for generated plate layouts keyed by a content-derived ID."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:  # pragma: no cover - import shim for direct execution
+    from .services import LAYOUT_VERSION
+except ImportError:  # pragma: no cover - fallback when run as a script
+    from services import LAYOUT_VERSION  # type: ignore
+
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[1] / "data" / "layouts.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Reads only refresh ``accessed_at`` once it is this many seconds stale, so
+# repeated fetches of a hot layout stay read-only.
+ACCESS_TIME_RESOLUTION = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS layouts (
+    layout_id TEXT PRIMARY KEY,
+    design TEXT NOT NULL,
+    plate_count INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS layouts_accessed_at ON layouts (accessed_at);
+CREATE TABLE IF NOT EXISTS plates (
+    layout_id TEXT NOT NULL REFERENCES layouts (layout_id) ON DELETE CASCADE,
+    plate_index INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (layout_id, plate_index)
+);
+"""
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def layout_id_for(design: Dict[str, Any]) -> str:
+    """Return the stable ID for a validated plate map design.
+
+    The ID depends on the normalized design parameters and ``LAYOUT_VERSION``,
+    so posting the same design twice resolves to the same stored layout until
+    the plate generator changes.
+    """
+
+    keyed = {"layout_version": LAYOUT_VERSION, "design": design}
+    return hashlib.sha256(_canonical_json(keyed).encode("utf-8")).hexdigest()[:32]
+
+
+class LayoutStore:
+    """Persist plate layouts and evict the least recently read ones past a size budget."""
+
+    def __init__(self, path: Path = DEFAULT_STORE_PATH, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("'max_bytes' must be greater than zero")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        if str(path) != ":memory:":
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def save(self, design: Dict[str, Any], plates: List[Dict[str, object]]) -> str:
+        """Store ``plates`` for ``design`` and return the layout ID."""
+
+        layout_id = layout_id_for(design)
+        bodies = [_canonical_json(plate) for plate in plates]
+        design_json = _canonical_json(design)
+        size_bytes = len(design_json) + sum(len(body) for body in bodies)
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO layouts "
+                "(layout_id, design, plate_count, size_bytes, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (layout_id, design_json, len(bodies), size_bytes, now, now),
+            )
+            self._connection.execute("DELETE FROM plates WHERE layout_id = ?", (layout_id,))
+            self._connection.executemany(
+                "INSERT INTO plates (layout_id, plate_index, body) VALUES (?, ?, ?)",
+                [(layout_id, index, body) for index, body in enumerate(bodies)],
+            )
+            self._evict(keep=layout_id)
+        return layout_id
+
+    def contains(self, layout_id: str, plate_index: Optional[int] = None) -> bool:
+        """Return whether the layout, or one of its plates, is stored."""
+
+        with self._lock:
+            if plate_index is None:
+                row = self._connection.execute(
+                    "SELECT 1 FROM layouts WHERE layout_id = ?", (layout_id,)
+                ).fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT 1 FROM plates WHERE layout_id = ? AND plate_index = ?",
+                    (layout_id, plate_index),
+                ).fetchone()
+        return row is not None
+
+    def get_layout(self, layout_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored design and all of its plates, or ``None`` if unknown."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT design, accessed_at FROM layouts WHERE layout_id = ?", (layout_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            bodies = self._connection.execute(
+                "SELECT body FROM plates WHERE layout_id = ? ORDER BY plate_index",
+                (layout_id,),
+            ).fetchall()
+            self._touch(layout_id, row[1])
+        return {
+            "layout_id": layout_id,
+            "design": json.loads(row[0]),
+            "plates": [json.loads(body) for (body,) in bodies],
+        }
+
+    def get_plate(self, layout_id: str, plate_index: int) -> Optional[Dict[str, object]]:
+        """Return a single stored plate, or ``None`` if the layout or index is unknown."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT plates.body, layouts.accessed_at FROM plates "
+                "JOIN layouts ON layouts.layout_id = plates.layout_id "
+                "WHERE plates.layout_id = ? AND plates.plate_index = ?",
+                (layout_id, plate_index),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch(layout_id, row[1])
+        return json.loads(row[0])
+
+    def _touch(self, layout_id: str, accessed_at: float) -> None:
+        now = time.time()
+        if now - accessed_at < ACCESS_TIME_RESOLUTION:
+            return
+        with self._connection:
+            self._connection.execute(
+                "UPDATE layouts SET accessed_at = ? WHERE layout_id = ?",
+                (now, layout_id),
+            )
+
+    def _evict(self, keep: str) -> None:
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM layouts"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        candidates = self._connection.execute(
+            "SELECT layout_id, size_bytes FROM layouts "
+            "WHERE layout_id != ? ORDER BY accessed_at",
+            (keep,),
+        ).fetchall()
+        for layout_id, size_bytes in candidates:
+            if total <= self.max_bytes:
+                break
+            self._connection.execute("DELETE FROM layouts WHERE layout_id = ?", (layout_id,))
+            total -= size_bytes
@@ -118,6 +118,53 @@ function ensureDilutionRows() {
 
 ensureDilutionRows();
 
+function parseSseFrame(frame) {
+  let event = 'message';
+  const dataLines = [];
+  frame.split('\n').forEach((line) => {
+    if (line.startsWith('event:')) {
+      event = line.slice(6).trim();
+    } else if (line.startsWith('data:')) {
+      dataLines.push(line.slice(5).trimStart());
+    }
+  });
+  if (!dataLines.length) {
+    return null;
+  }
+  return { event, data: JSON.parse(dataLines.join('\n')) };
+}
+
+async function* readSseEvents(response) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += decoder.decode(value, { stream: true }).replace(/\r\n/g, '\n');
+    let boundary = buffer.indexOf('\n\n');
+    while (boundary !== -1) {
+      const parsed = parseSseFrame(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+      if (parsed) {
+        yield parsed;
+      }
+      boundary = buffer.indexOf('\n\n');
+    }
+  }
+}
+
+function updatePlateSummary(completed, total) {
+  const count = `${completed} plate${completed === 1 ? '' : 's'}`;
+  plateSummary.textContent =
+    total && completed < total ? `${count} of ${total} generated…` : `${count} generated.`;
+}
+
+let plateStreamController = null;
+
 async function generatePlateMap() {
   const testArticles = parseListInput(testArticlesInput.value);
   const cellLines = parseListInput(cellLinesInput.value);
@@ -130,11 +177,19 @@ async function generatePlateMap() {
 
   plateError.textContent = '';
 
+  // Abort any stream still in flight so its plates do not mix with the new ones.
+  if (plateStreamController) {
+    plateStreamController.abort();
+  }
+  const controller = new AbortController();
+  plateStreamController = controller;
+
   try {
-    const response = await fetch(`${API_BASE}/plate-map`, {
+    const response = await fetch(`${API_BASE}/plate-map/stream`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
+        Accept: 'text/event-stream',
       },
       body: JSON.stringify({
         test_articles: testArticles,
@@ -146,6 +201,7 @@ async function generatePlateMap() {
         include_unstained: includeUnstainedCheckbox.checked,
         condense_cell_lines: condenseCellLinesCheckbox.checked,
       }),
+      signal: controller.signal,
     });
 
     if (!response.ok) {
@@ -153,20 +209,51 @@ async function generatePlateMap() {
       throw new Error(error.detail || 'Unable to generate plate map.');
     }
 
-    const data = await response.json();
-    plateMaps = Array.isArray(data.plates) ? data.plates : [];
+    plateMaps = [];
+    plateContainer.innerHTML = '';
+    let total = 0;
+    let completed = false;
+
+    for await (const { event, data } of readSseEvents(response)) {
+      if (event === 'start') {
+        total = data.total;
+        updatePlateSummary(0, total);
+      } else if (event === 'plate') {
+        plateMaps.push(data.plate);
+        appendPlate(data.plate);
+        plateResultsSection.classList.remove('hidden');
+      } else if (event === 'progress') {
+        updatePlateSummary(data.completed, data.total);
+      } else if (event === 'done') {
+        completed = true;
+      } else if (event === 'error') {
+        throw new Error(data.detail || 'Unable to generate plate map.');
+      }
+    }
+
+    if (!completed) {
+      throw new Error('The connection closed before every plate was generated. Please try again.');
+    }
 
     if (plateMaps.length === 0) {
       plateResultsSection.classList.add('hidden');
       return;
     }
 
-    plateSummary.textContent = `${plateMaps.length} plate${plateMaps.length > 1 ? 's' : ''} generated.`;
-    plateResultsSection.classList.remove('hidden');
-    renderPlateMaps();
+    updatePlateSummary(plateMaps.length, total);
   } catch (error) {
+    if (error.name === 'AbortError') {
+      return;
+    }
+    // Never leave a partial layout behind for the CSV and clipboard exports.
+    plateMaps = [];
+    plateContainer.innerHTML = '';
     plateError.textContent = error.message;
     plateResultsSection.classList.add('hidden');
+  } finally {
+    if (plateStreamController === controller) {
+      plateStreamController = null;
+    }
   }
 }
 
@@ -192,14 +279,7 @@ function getCellLineForFilename(plate) {
   return plate.cell_line || 'plate';
 }
 
-function renderPlateMaps() {
-  plateContainer.innerHTML = '';
-
-  if (!plateMaps.length) {
-    return;
-  }
-
-  const plate = plateMaps[0];
+function buildPlateElement(plate) {
   const plateElement = document.createElement('div');
   plateElement.className = 'plate';
 
@@ -222,41 +302,54 @@ function renderPlateMaps() {
   gridWrapper.className = 'plate-grid';
   const table = document.createElement('table');
 
-    const tbody = document.createElement('tbody');
-    const lookup = buildWellLookup(plate.wells);
+  const thead = document.createElement('thead');
+  const headerRow = document.createElement('tr');
+  headerRow.appendChild(document.createElement('th'));
+  COLUMN_LABELS.forEach((column) => {
+    const th = document.createElement('th');
+    th.textContent = column;
+    headerRow.appendChild(th);
+  });
+  thead.appendChild(headerRow);
 
-    ROW_LABELS.forEach((row) => {
-      const tr = document.createElement('tr');
-      const rowHeader = document.createElement('td');
-      rowHeader.textContent = row;
-      tr.appendChild(rowHeader);
+  const tbody = document.createElement('tbody');
+  const lookup = buildWellLookup(plate.wells);
 
-      COLUMN_LABELS.forEach((column) => {
-        const td = document.createElement('td');
-        const well = lookup.get(`${row}${column}`);
-        if (well) {
-          td.innerHTML = `
-            <div class="well">
-              <span>${well.test_article}</span>
-              <span class="id">${well.well_id}</span>
-            </div>
-          `;
-        } else {
-          td.innerHTML = '<span class="placeholder">—</span>';
-        }
-        tr.appendChild(td);
-      });
+  ROW_LABELS.forEach((row) => {
+    const tr = document.createElement('tr');
+    const rowHeader = document.createElement('td');
+    rowHeader.textContent = row;
+    tr.appendChild(rowHeader);
 
-      tbody.appendChild(tr);
+    COLUMN_LABELS.forEach((column) => {
+      const td = document.createElement('td');
+      const well = lookup.get(`${row}${column}`);
+      if (well) {
+        td.innerHTML = `
+          <div class="well">
+            <span>${well.test_article}</span>
+            <span class="id">${well.well_id}</span>
+          </div>
+        `;
+      } else {
+        td.innerHTML = '<span class="placeholder">—</span>';
+      }
+      tr.appendChild(td);
     });
 
-    table.appendChild(thead);
-    table.appendChild(tbody);
-    gridWrapper.appendChild(table);
-    plateElement.appendChild(header);
-    plateElement.appendChild(gridWrapper);
-    plateContainer.appendChild(plateElement);
+    tbody.appendChild(tr);
   });
+
+  table.appendChild(thead);
+  table.appendChild(tbody);
+  gridWrapper.appendChild(table);
+  plateElement.appendChild(header);
+  plateElement.appendChild(gridWrapper);
+  return plateElement;
+}
+
+function appendPlate(plate) {
+  plateContainer.appendChild(buildPlateElement(plate));
 }
 
 function buildCsvRows() {